@@ -0,0 +1,72 @@
+"""
+Shared Python package lists for the setup scripts.
+
+Single source of truth so setup_all.py and setup_kokoro.py resolve each
+requirement exactly once instead of declaring overlapping lists.
+"""
+
+from importlib.metadata import version, PackageNotFoundError
+
+# Vosk dependencies
+VOSK_PKGS = [
+    "vosk>=0.3.45",
+    "pyaudio>=0.2.11",
+]
+
+# Kokoro dependencies
+KOKORO_PKGS = [
+    "torch>=1.9.0",
+    "torchaudio>=0.9.0",
+    "flask>=2.0.0",
+    "flask-cors>=3.0.0",
+    "librosa>=0.8.0",
+    "soundfile>=0.10.0",
+]
+
+# Common dependencies
+COMMON_PKGS = [
+    "numpy>=1.21.0",
+    "scipy>=1.7.0",
+    "requests>=2.25.0",
+]
+
+def _requirement_name(spec):
+    """Distribution name part of a requirement spec like 'numpy>=1.21.0'."""
+    name = spec
+    for sep in "<>=!~;[":
+        name = name.split(sep, 1)[0]
+    return name.strip()
+
+def missing_packages(packages):
+    """Filter a requirement list down to the specs not already satisfied.
+
+    Checks installed distributions in-process via importlib.metadata so the
+    common "everything already installed" case never spawns pip at all.
+    Version constraints are checked with the packaging module (or pip's
+    vendored copy of it); if neither is importable, any spec carrying a
+    constraint is reported missing so pip gets to decide — treating an
+    unverifiable constraint as satisfied could pin a too-old install.
+    """
+    try:
+        from packaging.requirements import Requirement
+    except ImportError:
+        try:
+            from pip._vendor.packaging.requirements import Requirement
+        except ImportError:
+            Requirement = None
+
+    missing = []
+    for spec in packages:
+        try:
+            installed = version(_requirement_name(spec))
+        except PackageNotFoundError:
+            missing.append(spec)
+            continue
+        if Requirement is not None:
+            specifier = Requirement(spec).specifier
+            if specifier and installed not in specifier:
+                missing.append(spec)
+        elif spec != _requirement_name(spec):
+            # Constrained spec with no way to verify the constraint.
+            missing.append(spec)
+    return missing
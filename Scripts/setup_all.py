@@ -4,15 +4,67 @@ Personal AI Assistant - Complete Setup Script
 This script sets up all external dependencies for the Personal AI Assistant.
 """
 
+import hashlib
+import io
 import os
 import sys
 import subprocess
 import json
+import tempfile
+import threading
+import time
 import urllib.request
 import zipfile
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+from _requirements import VOSK_PKGS, KOKORO_PKGS, COMMON_PKGS, missing_packages
+
+# Serializes header/step banners so concurrent setup steps don't interleave.
+PRINT_LOCK = threading.Lock()
+
+# Local pip cache shared across setup runs: warm re-runs hit cached wheels
+# instead of re-downloading them.
+PIP_CACHE_DIR = ".pip-cache"
+PIP_INSTALL_ARGS = ["--cache-dir", PIP_CACHE_DIR, "--prefer-binary"]
+
+def pip_env():
+    """Environment for pip subprocesses (skips the version self-check ping)."""
+    return {**os.environ, "PIP_DISABLE_PIP_VERSION_CHECK": "1"}
+
+def packages_digest(packages):
+    """Stable hash of a package list, used to skip redundant pip runs."""
+    return hashlib.sha256("\n".join(sorted(packages)).encode()).hexdigest()
+
+def packages_already_installed(sentinel, packages):
+    """Check the sentinel file recording the last successfully installed set."""
+    try:
+        return sentinel.read_text(errors="ignore").strip() == packages_digest(packages)
+    except OSError:
+        return False
+
+class StepLogger:
+    """Collects log lines for a step and emits them in one stdout write.
+
+    Collapses the many per-item print() calls (one console syscall each)
+    into a single write at the end of the step, which also keeps output
+    from the concurrent steps grouped together.
+    """
+
+    def __init__(self):
+        self._lines = []
+
+    def log(self, message):
+        self._lines.append(message)
+
+    def flush(self):
+        if self._lines:
+            with PRINT_LOCK:
+                sys.stdout.write("\n".join(self._lines) + "\n")
+                sys.stdout.flush()
+            self._lines.clear()
+
 def print_header(title):
     """Print a formatted header."""
     print("\n" + "=" * 60)
@@ -21,8 +73,9 @@ def print_header(title):
 
 def print_step(step_num, total_steps, description):
     """Print a formatted step."""
-    print(f"\n[{step_num}/{total_steps}] {description}")
-    print("-" * 40)
+    with PRINT_LOCK:
+        print(f"\n[{step_num}/{total_steps}] {description}")
+        print("-" * 40)
 
 def check_python_version():
     """Check if Python version is compatible."""
@@ -33,13 +86,40 @@ def check_python_version():
     print(f"✓ Python {sys.version_info.major}.{sys.version_info.minor} detected")
     return True
 
+# Probe results cached here so warm re-runs skip the dotnet subprocess.
+SETUP_CACHE = Path(".setup-cache.json")
+SETUP_CACHE_TTL = 86400  # seconds
+
+def read_setup_cache():
+    """Read the probe cache, or an empty dict if stale or missing."""
+    try:
+        if time.time() - SETUP_CACHE.stat().st_mtime < SETUP_CACHE_TTL:
+            return json.loads(SETUP_CACHE.read_text())
+    except (OSError, ValueError):
+        pass
+    return {}
+
+def write_setup_cache(entries):
+    """Merge entries into the probe cache."""
+    cache = read_setup_cache()
+    cache.update(entries)
+    try:
+        SETUP_CACHE.write_text(json.dumps(cache))
+    except OSError:
+        pass
+
 def check_dotnet():
     """Check if .NET is installed."""
+    cached = read_setup_cache().get("dotnet")
+    if cached:
+        print(f"✓ .NET {cached} detected (cached)")
+        return True
     try:
-        result = subprocess.run(["dotnet", "--version"], 
+        result = subprocess.run(["dotnet", "--version"],
                               capture_output=True, text=True, check=True)
         version = result.stdout.strip()
         print(f"✓ .NET {version} detected")
+        write_setup_cache({"dotnet": version, "checked_at": time.time()})
         return True
     except (subprocess.CalledProcessError, FileNotFoundError):
         print("✗ .NET not found")
@@ -48,51 +128,70 @@ def check_dotnet():
 
 def install_python_packages():
     """Install all required Python packages."""
-    packages = [
-        # Vosk dependencies
-        "vosk>=0.3.45",
-        "pyaudio>=0.2.11",
-        
-        # Kokoro dependencies
-        "torch>=1.9.0",
-        "torchaudio>=0.9.0",
-        "flask>=2.0.0",
-        "flask-cors>=3.0.0",
-        "librosa>=0.8.0",
-        "soundfile>=0.10.0",
-        
-        # Common dependencies
-        "numpy>=1.21.0",
-        "scipy>=1.7.0",
-        "requests>=2.25.0"
-    ]
-    
-    print("Installing Python packages...")
+    packages = VOSK_PKGS + KOKORO_PKGS + COMMON_PKGS
+
+    # Skip pip entirely when this exact package set already installed cleanly:
+    # the hot re-run path becomes a single file read.
+    logger = StepLogger()
+    sentinel = Path(PIP_CACHE_DIR) / "installed.sha256"
+    full_digest = packages_digest(packages)
+    if packages_already_installed(sentinel, packages):
+        print("✓ Python packages already installed (cached)")
+        return True
+
+    # Drop requirements the environment already satisfies so pip only sees
+    # what's actually missing — and isn't spawned at all when nothing is.
+    to_install = missing_packages(packages)
+    if not to_install:
+        sentinel.write_text(full_digest)
+        print("✓ All Python packages already installed")
+        return True
+    packages = to_install
+
+    logger.log("Installing Python packages...")
     failed_packages = []
-    
-    for package in packages:
-        try:
-            print(f"Installing {package}...", end=" ")
-            subprocess.check_call(
-                [sys.executable, "-m", "pip", "install", package],
+
+    Path(PIP_CACHE_DIR).mkdir(exist_ok=True)
+
+    # Install everything in one pip invocation so the resolver runs once
+    # instead of paying a fresh interpreter + resolver start per package.
+    result = subprocess.run(
+        [sys.executable, "-m", "pip", "install", *PIP_INSTALL_ARGS, *packages],
+        capture_output=True, text=True, check=False, env=pip_env()
+    )
+    if result.returncode == 0:
+        logger.log(f"✓ Installed {len(packages)} packages")
+    else:
+        # Batch failed; retry one-by-one to identify the offending package(s).
+        logger.log("⚠ Batch install failed, retrying packages individually...")
+        for package in packages:
+            retry = subprocess.run(
+                [sys.executable, "-m", "pip", "install", *PIP_INSTALL_ARGS, package],
                 stdout=subprocess.DEVNULL,
-                stderr=subprocess.DEVNULL
+                stderr=subprocess.PIPE,
+                text=True,
+                env=pip_env()
             )
-            print("✓")
-        except subprocess.CalledProcessError:
-            print("✗")
-            failed_packages.append(package)
-    
+            if retry.returncode == 0:
+                logger.log(f"Installing {package}... ✓")
+            else:
+                logger.log(f"Installing {package}... ✗")
+                logger.log(retry.stderr.strip())
+                failed_packages.append(package)
+
     if failed_packages:
-        print(f"\n⚠ Failed to install: {', '.join(failed_packages)}")
+        logger.log(f"⚠ Failed to install: {', '.join(failed_packages)}")
         if any("pyaudio" in pkg for pkg in failed_packages):
-            print("\nPyAudio installation help:")
-            print("  Windows: Install Microsoft Visual C++ Build Tools")
-            print("  Ubuntu/Debian: sudo apt-get install portaudio19-dev python3-pyaudio")
-            print("  macOS: brew install portaudio")
+            logger.log("PyAudio installation help:")
+            logger.log("  Windows: Install Microsoft Visual C++ Build Tools")
+            logger.log("  Ubuntu/Debian: sudo apt-get install portaudio19-dev python3-pyaudio")
+            logger.log("  macOS: brew install portaudio")
+        logger.flush()
         return False
-    
-    print("✓ All Python packages installed successfully")
+
+    sentinel.write_text(full_digest)
+    logger.log("✓ All Python packages installed successfully")
+    logger.flush()
     return True
 
 def setup_directories():
@@ -102,135 +201,220 @@ def setup_directories():
         "kokoro_models",
         "logs",
         "config",
-        "temp"
+        "temp",
+        PIP_CACHE_DIR
     ]
     
-    print("Creating directories...")
+    logger = StepLogger()
+    logger.log("Creating directories...")
     for directory in directories:
-        Path(directory).mkdir(exist_ok=True)
-        print(f"✓ Created {directory}/")
-    
+        # Attempt the mkdir and swallow EEXIST rather than stat-then-create:
+        # one syscall per directory when cold, and no output noise when warm.
+        try:
+            Path(directory).mkdir(parents=True)
+            logger.log(f"✓ Created {directory}/")
+        except FileExistsError:
+            pass
+
+    logger.flush()
     return True
 
+# sha256 of the small Vosk model zip; fill in to verify download integrity.
+VOSK_MODEL_SHA256 = None
+
 def download_vosk_model():
     """Download a lightweight Vosk model for testing."""
     model_name = "vosk-model-small-en-us-0.15"
     model_url = f"https://alphacephei.com/vosk/models/{model_name}.zip"
     model_dir = Path("vosk_models") / model_name
     
-    if model_dir.exists():
-        print(f"✓ {model_name} already exists")
-        return True
-    
-    print(f"Downloading {model_name} (40MB)...")
-    zip_path = Path("vosk_models") / f"{model_name}.zip"
-    
+    # A completion sentinel records the size of the zip we extracted. On
+    # re-runs a HEAD request (headers only, no body) confirms the upstream
+    # file still matches; a partial extract from a crashed run has no
+    # sentinel and is re-fetched instead of silently passing.
+    sentinel = model_dir.parent / f"{model_name}.ok"
+    if sentinel.exists():
+        try:
+            head = urllib.request.Request(model_url, method="HEAD")
+            with urllib.request.urlopen(head) as response:
+                if response.headers.get("Content-Length") == sentinel.read_text().strip():
+                    print(f"✓ {model_name} already exists")
+                    return True
+        except Exception:
+            # Offline or HEAD unsupported: trust the sentinel.
+            if model_dir.exists():
+                print(f"✓ {model_name} already exists")
+                return True
+
+    logger = StepLogger()
+    logger.log(f"Downloading {model_name} (40MB)...")
+
     try:
-        urllib.request.urlretrieve(model_url, str(zip_path))
-        print("✓ Download completed")
-        
-        print("Extracting model...")
-        with zipfile.ZipFile(zip_path, 'r') as zip_ref:
-            zip_ref.extractall("vosk_models")
-        
-        zip_path.unlink()  # Remove zip file
-        print("✓ Model extracted successfully")
+        # Stream the zip into memory and extract in one pass: no zip file on
+        # disk, no re-read for extraction, no unlink afterwards.
+        with urllib.request.urlopen(model_url) as response:
+            buf = io.BytesIO(response.read())
+        if VOSK_MODEL_SHA256 is not None:
+            digest = hashlib.sha256(buf.getvalue()).hexdigest()
+            if digest != VOSK_MODEL_SHA256:
+                logger.log("✗ Downloaded model failed checksum verification")
+                logger.flush()
+                return False
+        logger.log("✓ Download completed")
+
+        logger.log("Extracting model...")
+        # Stream each member out with a 1MB buffer instead of extractall's
+        # default 8KB, cutting write syscalls ~128x per file. Member names
+        # are checked against the output root (the sanitization extractall
+        # did for us) so a hostile archive can't write outside it.
+        extract_root = Path("vosk_models").resolve()
+        with zipfile.ZipFile(buf) as zip_ref:
+            for member in zip_ref.infolist():
+                target = (extract_root / member.filename).resolve()
+                if target != extract_root and extract_root not in target.parents:
+                    raise ValueError(f"unsafe path in archive: {member.filename!r}")
+                if member.is_dir():
+                    target.mkdir(parents=True, exist_ok=True)
+                    continue
+                target.parent.mkdir(parents=True, exist_ok=True)
+                with zip_ref.open(member) as src, open(target, "wb") as dst:
+                    shutil.copyfileobj(src, dst, length=1 << 20)
+
+        sentinel.write_text(str(len(buf.getvalue())))
+        logger.log("✓ Model extracted successfully")
+        logger.flush()
         return True
-    
+
     except Exception as e:
-        print(f"✗ Failed to download Vosk model: {e}")
-        print("  You can download it manually from:")
-        print(f"  {model_url}")
+        logger.log(f"✗ Failed to download Vosk model: {e}")
+        logger.log("  You can download it manually from:")
+        logger.log(f"  {model_url}")
+        logger.flush()
         return False
 
-def create_configuration_files():
-    """Create default configuration files."""
-    # Vosk configuration
-    vosk_config = {
-        "default_model": "vosk-model-small-en-us-0.15",
-        "models_directory": "vosk_models",
-        "sample_rate": 16000,
-        "channels": 1,
-        "chunk_size": 4096,
-        "enable_partial_results": True,
-        "log_level": "INFO"
-    }
-    
-    with open("config/vosk_config.json", "w") as f:
-        json.dump(vosk_config, f, indent=2)
-    print("✓ Created vosk_config.json")
-    
-    # Kokoro configuration
-    kokoro_config = {
-        "server_url": "http://localhost:5000",
-        "default_voice": "default",
-        "timeout": 30,
-        "max_text_length": 1000,
-        "audio_format": "wav",
-        "sample_rate": 22050
-    }
-    
-    with open("config/kokoro_config.json", "w") as f:
-        json.dump(kokoro_config, f, indent=2)
-    print("✓ Created kokoro_config.json")
-    
-    # Application configuration template
-    app_config = {
-        "voice_services": {
-            "wake_word": {
-                "enabled": True,
-                "sensitivity": 0.5,
-                "keywords": ["hey assistant", "computer"]
-            },
-            "stt": {
-                "enabled": True,
-                "model_path": "vosk_models/vosk-model-small-en-us-0.15",
-                "timeout": 5
-            },
-            "tts": {
-                "enabled": True,
-                "server_url": "http://localhost:5000",
-                "voice": "default"
-            }
-        },
-        "llm": {
-            "provider": "openai",
-            "api_key": "your_api_key_here",
-            "model": "gpt-3.5-turbo",
-            "max_tokens": 150
+# Default configuration templates. These are constants, so their JSON form
+# is rendered once at import instead of on every create_configuration_files
+# call.
+VOSK_CONFIG = {
+    "default_model": "vosk-model-small-en-us-0.15",
+    "models_directory": "vosk_models",
+    "sample_rate": 16000,
+    "channels": 1,
+    "chunk_size": 4096,
+    "enable_partial_results": True,
+    "log_level": "INFO"
+}
+
+KOKORO_CONFIG = {
+    "server_url": "http://localhost:5000",
+    "default_voice": "default",
+    "timeout": 30,
+    "max_text_length": 1000,
+    "audio_format": "wav",
+    "sample_rate": 22050
+}
+
+APP_CONFIG_TEMPLATE = {
+    "voice_services": {
+        "wake_word": {
+            "enabled": True,
+            "sensitivity": 0.5,
+            "keywords": ["hey assistant", "computer"]
         },
-        "microsoft_todo": {
-            "client_id": "your_client_id_here",
-            "tenant_id": "common"
+        "stt": {
+            "enabled": True,
+            "model_path": "vosk_models/vosk-model-small-en-us-0.15",
+            "timeout": 5
         },
-        "prayer_times": {
-            "latitude": 0.0,
-            "longitude": 0.0,
-            "method": 2,
-            "timezone": "UTC"
-        },
-        "activity_watch": {
-            "server_url": "http://localhost:5600",
-            "enabled": False
-        },
-        "logging": {
-            "level": "INFO",
-            "file": "logs/app.log",
-            "max_size_mb": 10
+        "tts": {
+            "enabled": True,
+            "server_url": "http://localhost:5000",
+            "voice": "default"
         }
+    },
+    "llm": {
+        "provider": "openai",
+        "api_key": "your_api_key_here",
+        "model": "gpt-3.5-turbo",
+        "max_tokens": 150
+    },
+    "microsoft_todo": {
+        "client_id": "your_client_id_here",
+        "tenant_id": "common"
+    },
+    "prayer_times": {
+        "latitude": 0.0,
+        "longitude": 0.0,
+        "method": 2,
+        "timezone": "UTC"
+    },
+    "activity_watch": {
+        "server_url": "http://localhost:5600",
+        "enabled": False
+    },
+    "logging": {
+        "level": "INFO",
+        "file": "logs/app.log",
+        "max_size_mb": 10
     }
-    
-    with open("config/app_config.json", "w") as f:
-        json.dump(app_config, f, indent=2)
-    print("✓ Created app_config.json template")
-    
+}
+
+def config_json(obj):
+    """Render a config dict to its on-disk JSON byte form."""
+    return json.dumps(obj, indent=2).encode()
+
+# Serialized once at import; create_configuration_files just writes bytes.
+VOSK_CONFIG_JSON = config_json(VOSK_CONFIG)
+KOKORO_CONFIG_JSON = config_json(KOKORO_CONFIG)
+APP_CONFIG_JSON = config_json(APP_CONFIG_TEMPLATE)
+
+def write_if_changed(path, new):
+    """Write bytes only when the on-disk content would change.
+
+    Returns True when the file was written, False when it was already
+    up to date (no write syscall on the happy path).
+    """
+    path = Path(path)
+    if path.exists() and path.read_bytes() == new:
+        return False
+    path.write_bytes(new)
     return True
 
-def create_startup_scripts():
-    """Create startup scripts for external services."""
-    # Kokoro server startup script
-    if os.name == 'nt':  # Windows
-        kokoro_script = '''@echo off
+def create_configuration_files():
+    """Create default configuration files."""
+    logger = StepLogger()
+    if write_if_changed("config/vosk_config.json", VOSK_CONFIG_JSON):
+        logger.log("✓ Created vosk_config.json")
+    else:
+        logger.log("✓ vosk_config.json up to date")
+
+    if write_if_changed("config/kokoro_config.json", KOKORO_CONFIG_JSON):
+        logger.log("✓ Created kokoro_config.json")
+    else:
+        logger.log("✓ kokoro_config.json up to date")
+
+    # Merge over any existing app config so user-entered API keys and
+    # settings survive re-running setup.
+    app_config_path = Path("config/app_config.json")
+    app_config_bytes = APP_CONFIG_JSON
+    if app_config_path.exists():
+        try:
+            existing = json.loads(app_config_path.read_text())
+            app_config_bytes = config_json({**APP_CONFIG_TEMPLATE, **existing})
+        except ValueError:
+            pass
+    if write_if_changed(app_config_path, app_config_bytes):
+        logger.log("✓ Created app_config.json template")
+    else:
+        logger.log("✓ app_config.json up to date")
+
+    logger.flush()
+    return True
+
+# Startup script templates, rendered once at setup time. The app scripts
+# take the actual built binary path so launching the app costs a single
+# exec instead of probing Debug/Release locations on every start.
+KOKORO_SCRIPT_WINDOWS = '''@echo off
 echo Starting Kokoro TTS Server...
 cd /d "%~dp0"
 python setup_kokoro.py
@@ -241,90 +425,138 @@ if exist kokoro_server.py (
     pause
 )
 '''
-        with open("start_kokoro.bat", "w") as f:
-            f.write(kokoro_script)
-        print("✓ Created start_kokoro.bat")
-        
-        # Main application startup script
-        app_script = '''@echo off
+
+KOKORO_SCRIPT_UNIX = '''#!/bin/bash
+echo "Starting Kokoro TTS Server..."
+cd "$(dirname "$0")"
+python3 setup_kokoro.py
+if [ -f "kokoro_server.py" ]; then
+    python3 kokoro_server.py
+else
+    echo "Kokoro server not found. Please run setup_kokoro.py first."
+fi
+'''
+
+APP_SCRIPT_WINDOWS_TEMPLATE = '''@echo off
 echo Starting Personal AI Assistant...
 cd /d "%~dp0"
-if exist "bin\\Debug\\net6.0-windows\\PersonalAiAssistant.exe" (
-    start "" "bin\\Debug\\net6.0-windows\\PersonalAiAssistant.exe"
-) else if exist "bin\\Release\\net6.0-windows\\PersonalAiAssistant.exe" (
-    start "" "bin\\Release\\net6.0-windows\\PersonalAiAssistant.exe"
+if exist "{app_path}" (
+    start "" "{app_path}"
 ) else (
     echo Application not built. Building now...
     dotnet build
-    if exist "bin\\Debug\\net6.0-windows\\PersonalAiAssistant.exe" (
-        start "" "bin\\Debug\\net6.0-windows\\PersonalAiAssistant.exe"
+    if exist "{app_path}" (
+        start "" "{app_path}"
     ) else (
         echo Build failed. Please check for errors.
         pause
     )
 )
 '''
-        with open("start_app.bat", "w") as f:
-            f.write(app_script)
-        print("✓ Created start_app.bat")
-    
-    else:  # Unix-like
-        kokoro_script = '''#!/bin/bash
-echo "Starting Kokoro TTS Server..."
-cd "$(dirname "$0")"
-python3 setup_kokoro.py
-if [ -f "kokoro_server.py" ]; then
-    python3 kokoro_server.py
-else
-    echo "Kokoro server not found. Please run setup_kokoro.py first."
-fi
-'''
-        with open("start_kokoro.sh", "w") as f:
-            f.write(kokoro_script)
-        os.chmod("start_kokoro.sh", 0o755)
-        print("✓ Created start_kokoro.sh")
-        
-        app_script = '''#!/bin/bash
+
+APP_SCRIPT_UNIX_TEMPLATE = '''#!/bin/bash
 echo "Starting Personal AI Assistant..."
 cd "$(dirname "$0")"
-if [ -f "bin/Debug/net6.0/PersonalAiAssistant" ]; then
-    ./bin/Debug/net6.0/PersonalAiAssistant
-elif [ -f "bin/Release/net6.0/PersonalAiAssistant" ]; then
-    ./bin/Release/net6.0/PersonalAiAssistant
+if [ -f "{app_path}" ]; then
+    ./{app_path}
 else
     echo "Application not built. Building now..."
     dotnet build
-    if [ -f "bin/Debug/net6.0/PersonalAiAssistant" ]; then
-        ./bin/Debug/net6.0/PersonalAiAssistant
+    if [ -f "{app_path}" ]; then
+        ./{app_path}
     else
         echo "Build failed. Please check for errors."
     fi
 fi
 '''
-        with open("start_app.sh", "w") as f:
-            f.write(app_script)
-        os.chmod("start_app.sh", 0o755)
-        print("✓ Created start_app.sh")
-    
+
+def built_app_path(candidates, default):
+    """Pick the binary that actually exists, or the default build output."""
+    return next((p for p in candidates if Path(p).exists()), default)
+
+def create_startup_scripts():
+    """Create startup scripts for external services."""
+    if os.name == 'nt':  # Windows
+        app_path = built_app_path(
+            ("bin\\Debug\\net6.0-windows\\PersonalAiAssistant.exe",
+             "bin\\Release\\net6.0-windows\\PersonalAiAssistant.exe"),
+            "bin\\Debug\\net6.0-windows\\PersonalAiAssistant.exe")
+        scripts = [
+            ("start_kokoro.bat", KOKORO_SCRIPT_WINDOWS),
+            ("start_app.bat", APP_SCRIPT_WINDOWS_TEMPLATE.format(app_path=app_path)),
+        ]
+    else:  # Unix-like
+        app_path = built_app_path(
+            ("bin/Debug/net6.0/PersonalAiAssistant",
+             "bin/Release/net6.0/PersonalAiAssistant"),
+            "bin/Debug/net6.0/PersonalAiAssistant")
+        scripts = [
+            ("start_kokoro.sh", KOKORO_SCRIPT_UNIX),
+            ("start_app.sh", APP_SCRIPT_UNIX_TEMPLATE.format(app_path=app_path)),
+        ]
+
+    for name, content in scripts:
+        if write_if_changed(name, content.encode()):
+            print(f"✓ Created {name}")
+        else:
+            print(f"✓ {name} up to date")
+        if os.name != 'nt':
+            os.chmod(name, 0o755)
+
     return True
 
+def dotnet_env():
+    """Environment for dotnet subprocesses (no telemetry, no first-run work)."""
+    return {**os.environ,
+            "DOTNET_CLI_TELEMETRY_OPTOUT": "1",
+            "DOTNET_SKIP_FIRST_TIME_EXPERIENCE": "1",
+            "DOTNET_NOLOGO": "1"}
+
+def restore_is_fresh():
+    """True when obj/project.assets.json is newer than every .csproj."""
+    assets = Path("obj/project.assets.json")
+    if not assets.exists():
+        return False
+    assets_mtime = assets.stat().st_mtime
+    return all(assets_mtime >= csproj.stat().st_mtime
+               for csproj in Path(".").glob("*.csproj"))
+
+def run_dotnet(args):
+    """Run a dotnet command, keeping its output out of Python's memory.
+
+    MSBuild writes diagnostics (including compile errors) to stdout, so it
+    can't just go to DEVNULL: stdout and stderr are spooled to a temp file
+    on disk instead of a pipe buffer. On success nothing is read back; on
+    failure the log is printed. Returns the process return code.
+    """
+    with tempfile.TemporaryFile(mode="w+", errors="replace") as log:
+        proc = subprocess.run(args, stdout=log, stderr=subprocess.STDOUT,
+                              env=dotnet_env())
+        if proc.returncode:
+            log.seek(0)
+            shutil.copyfileobj(log, sys.stdout)
+        return proc.returncode
+
 def build_dotnet_application():
     """Build the .NET application."""
     try:
+        # Restore only when the project file changed since the last restore,
+        # then build incrementally with the shared compiler server.
+        if not restore_is_fresh():
+            print("Restoring NuGet packages...")
+            if run_dotnet(["dotnet", "restore", "--nologo"]):
+                print("✗ Restore failed (output above)")
+                return False
         print("Building .NET application...")
-        result = subprocess.run(
-            ["dotnet", "build", "--configuration", "Debug"],
-            capture_output=True,
-            text=True,
-            check=True
-        )
+        if run_dotnet(["dotnet", "build", "--configuration", "Debug",
+                       "--no-restore", "--nologo",
+                       "/p:UseSharedCompilation=true"]):
+            print("✗ Build failed (output above)")
+            return False
         print("✓ Application built successfully")
         return True
-    except subprocess.CalledProcessError as e:
+    except FileNotFoundError as e:
         print(f"✗ Build failed: {e}")
-        print("Build output:")
-        print(e.stdout)
-        print(e.stderr)
         return False
 
 def create_readme():
@@ -459,58 +691,58 @@ def main():
     
     input("\nPress Enter to continue...")
     
-    total_steps = 9
+    total_steps = 7
     current_step = 0
-    
+
     # Step 1: Check system requirements
     current_step += 1
     print_step(current_step, total_steps, "Checking system requirements")
     if not check_python_version() or not check_dotnet():
         print("\n✗ System requirements not met. Please install missing components.")
         sys.exit(1)
-    
+
     # Step 2: Create directories
     current_step += 1
     print_step(current_step, total_steps, "Creating project directories")
     setup_directories()
-    
-    # Step 3: Install Python packages
+
+    # Step 3: Run the independent, long-running steps concurrently. Pip, the
+    # Vosk download, and the .NET build don't depend on each other, so total
+    # wall time approaches the slowest step instead of their sum.
     current_step += 1
-    print_step(current_step, total_steps, "Installing Python dependencies")
-    if not install_python_packages():
+    print_step(current_step, total_steps,
+               "Installing dependencies, downloading Vosk model, building application")
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        f_pip = executor.submit(install_python_packages)
+        f_vosk = executor.submit(download_vosk_model)
+        f_build = executor.submit(build_dotnet_application)
+        results = {name: future.result() for name, future in
+                   [("pip", f_pip), ("vosk", f_vosk), ("dotnet", f_build)]}
+    if not results["pip"]:
         print("\n⚠ Some Python packages failed to install.")
         print("You may need to install them manually.")
-    
-    # Step 4: Download Vosk model
-    current_step += 1
-    print_step(current_step, total_steps, "Downloading Vosk speech recognition model")
-    download_vosk_model()
-    
-    # Step 5: Create configuration files
+    if not results["dotnet"]:
+        print("\n⚠ Application build failed. You may need to build manually.")
+
+    # Step 4: Create configuration files
     current_step += 1
     print_step(current_step, total_steps, "Creating configuration files")
     create_configuration_files()
-    
-    # Step 6: Create startup scripts
+
+    # Step 5: Create startup scripts
     current_step += 1
     print_step(current_step, total_steps, "Creating startup scripts")
     create_startup_scripts()
-    
-    # Step 7: Build .NET application
-    current_step += 1
-    print_step(current_step, total_steps, "Building .NET application")
-    if not build_dotnet_application():
-        print("\n⚠ Application build failed. You may need to build manually.")
-    
-    # Step 8: Create documentation
+
+    # Step 6: Create documentation
     current_step += 1
     print_step(current_step, total_steps, "Creating documentation")
     create_readme()
-    
-    # Step 9: Final setup
+
+    # Step 7: Final setup
     current_step += 1
     print_step(current_step, total_steps, "Finalizing setup")
-    
+
     print_header("Setup Complete!")
     print("✓ Personal AI Assistant setup completed successfully!")
     print("\nNext steps:")
@@ -4,14 +4,74 @@ Kokoro TTS Server Setup Script
 This script sets up the Kokoro TTS server for the Personal AI Assistant.
 """
 
+import hashlib
 import os
+import py_compile
 import sys
 import subprocess
+import urllib.error
 import urllib.request
 import zipfile
 import shutil
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
+from _requirements import KOKORO_PKGS, COMMON_PKGS, missing_packages
+
+# Same local pip cache as setup_all.py so both scripts share warm wheels.
+PIP_CACHE_DIR = ".pip-cache"
+PIP_INSTALL_ARGS = ["--cache-dir", PIP_CACHE_DIR, "--prefer-binary"]
+
+def pip_env():
+    """Environment for pip subprocesses (skips the version self-check ping)."""
+    return {**os.environ, "PIP_DISABLE_PIP_VERSION_CHECK": "1"}
+
+# Known sha256 digests for downloaded model files; fill in alongside the real
+# model URLs to enable integrity verification after download.
+MODEL_CHECKSUMS = {}
+
+def download_file(url, dest, expected_sha256=None):
+    """Download url to dest, resuming a partial download if one exists.
+
+    Bytes are appended to a .part file, so a dropped connection only costs
+    the missing suffix on retry. When expected_sha256 is given the finished
+    file is verified before being moved into place; the rename is atomic so
+    dest either doesn't exist or is complete and valid.
+    """
+    dest = Path(dest)
+    part = dest.with_suffix(dest.suffix + ".part")
+    start = part.stat().st_size if part.exists() else 0
+
+    headers = {"Range": f"bytes={start}-"} if start else {}
+    request = urllib.request.Request(url, headers=headers)
+    try:
+        with urllib.request.urlopen(request) as response:
+            if start and response.getcode() != 206:
+                # Server ignored the Range request and is sending the full
+                # body; appending it would corrupt the file. Restart from
+                # offset zero instead.
+                start = 0
+            with open(part, "ab" if start else "wb") as f:
+                shutil.copyfileobj(response, f, 1 << 20)
+    except urllib.error.HTTPError as e:
+        if e.code == 416 and start:
+            # Requested range not satisfiable: the .part file is already the
+            # full download, fall through to verification.
+            pass
+        else:
+            raise
+
+    if expected_sha256 is not None:
+        digest = hashlib.sha256()
+        with open(part, "rb") as f:
+            for block in iter(lambda: f.read(1 << 20), b""):
+                digest.update(block)
+        if digest.hexdigest() != expected_sha256:
+            part.unlink()
+            raise ValueError(f"Checksum mismatch for {dest.name}")
+
+    part.replace(dest)
+
 def check_python_version():
     """Check if Python version is compatible."""
     if sys.version_info < (3, 8):
@@ -21,26 +81,54 @@ def check_python_version():
 
 def install_requirements():
     """Install required Python packages."""
-    requirements = [
-        "torch>=1.9.0",
-        "torchaudio>=0.9.0",
-        "numpy>=1.21.0",
-        "scipy>=1.7.0",
-        "flask>=2.0.0",
-        "flask-cors>=3.0.0",
-        "librosa>=0.8.0",
-        "soundfile>=0.10.0",
-        "requests>=2.25.0"
-    ]
-    
+    requirements = KOKORO_PKGS + COMMON_PKGS
+
+    # Skip pip entirely when this exact requirement set already installed
+    # cleanly on a previous run.
+    digest = hashlib.sha256("\n".join(sorted(requirements)).encode()).hexdigest()
+    sentinel = Path(PIP_CACHE_DIR) / "installed-kokoro.sha256"
+    try:
+        if sentinel.read_text(errors="ignore").strip() == digest:
+            print("✓ Python requirements already installed (cached)")
+            return True
+    except OSError:
+        pass
+
+    # Only hand pip the requirements the environment doesn't already satisfy.
+    to_install = missing_packages(requirements)
+    if not to_install:
+        Path(PIP_CACHE_DIR).mkdir(exist_ok=True)
+        sentinel.write_text(digest)
+        print("✓ All Python requirements already installed")
+        return True
+    requirements = to_install
+
     print("Installing Python requirements...")
+    Path(PIP_CACHE_DIR).mkdir(exist_ok=True)
+
+    # Single batched pip call: one resolver pass for all requirements.
+    result = subprocess.run(
+        [sys.executable, "-m", "pip", "install", *PIP_INSTALL_ARGS, *requirements],
+        capture_output=True, text=True, check=False, env=pip_env()
+    )
+    if result.returncode == 0:
+        print(f"✓ Installed {len(requirements)} requirements")
+        sentinel.write_text(digest)
+        return True
+
+    # Fall back to per-requirement installs to surface which one failed.
+    print("⚠ Batch install failed, retrying requirements individually...")
     for req in requirements:
         try:
-            subprocess.check_call([sys.executable, "-m", "pip", "install", req])
+            subprocess.check_call(
+                [sys.executable, "-m", "pip", "install", *PIP_INSTALL_ARGS, req],
+                env=pip_env()
+            )
             print(f"✓ Installed {req}")
         except subprocess.CalledProcessError:
             print(f"✗ Failed to install {req}")
             return False
+    sentinel.write_text(digest)
     return True
 
 def download_kokoro_model():
@@ -56,20 +144,37 @@ def download_kokoro_model():
     }
     
     print("Downloading Kokoro model files...")
+    missing = {}
     for filename, url in model_files.items():
-        filepath = model_dir / filename
-        if filepath.exists():
+        if (model_dir / filename).exists():
             print(f"✓ {filename} already exists")
-            continue
-            
-        try:
-            print(f"Downloading {filename}...")
-            urllib.request.urlretrieve(url, filepath)
-            print(f"✓ Downloaded {filename}")
-        except Exception as e:
-            print(f"✗ Failed to download {filename}: {e}")
-            print("Please download the model files manually and place them in the kokoro_models directory.")
-            return False
+        else:
+            missing[filename] = url
+
+    if not missing:
+        return True
+
+    # The files are independent, so fetch them in parallel: wall time drops
+    # from the sum of the download times to the slowest single file.
+    failed = False
+    with ThreadPoolExecutor(max_workers=min(8, len(missing))) as executor:
+        futures = {
+            executor.submit(download_file, url, model_dir / filename,
+                            MODEL_CHECKSUMS.get(filename)): filename
+            for filename, url in missing.items()
+        }
+        for future in as_completed(futures):
+            filename = futures[future]
+            try:
+                future.result()
+                print(f"✓ Downloaded {filename}")
+            except Exception as e:
+                print(f"✗ Failed to download {filename}: {e}")
+                failed = True
+
+    if failed:
+        print("Please download the model files manually and place them in the kokoro_models directory.")
+        return False
     return True
 
 def create_kokoro_server():
@@ -84,38 +189,51 @@ HTTP API server for Kokoro text-to-speech synthesis.
 import os
 import json
 import tempfile
+from functools import lru_cache
 from pathlib import Path
 from flask import Flask, request, jsonify, send_file
 from flask_cors import CORS
-import torch
-import torchaudio
-import numpy as np
 
 app = Flask(__name__)
-CORSS(app)
+CORS(app)
 
 # Global model variables
 model = None
 config = None
 
+# Heavy C-extension modules (torch alone costs 500-1500ms to import) are
+# deferred to load_model() so the server process itself starts instantly.
+torch = None
+torchaudio = None
+np = None
+
+@lru_cache(maxsize=None)
+def load_weights(model_path):
+    """Load model weights once per path; repeat calls hit the cache."""
+    return torch.load(model_path, map_location='cpu')
+
 def load_model():
     """Load the Kokoro TTS model."""
-    global model, config
-    
+    global model, config, torch, torchaudio, np
+
+    import torch
+    import torchaudio
+    import numpy as np
+
     model_dir = Path("kokoro_models")
     model_path = model_dir / "kokoro_model.pth"
     config_path = model_dir / "config.json"
-    
+
     if not model_path.exists() or not config_path.exists():
         raise FileNotFoundError("Model files not found. Please run setup_kokoro.py first.")
-    
+
     # Load configuration
     with open(config_path, 'r') as f:
         config = json.load(f)
-    
+
     # Load model (placeholder - replace with actual Kokoro loading code)
     try:
-        model = torch.load(model_path, map_location='cpu')
+        model = load_weights(str(model_path))
         model.eval()
         print("✓ Kokoro model loaded successfully")
     except Exception as e:
@@ -222,8 +340,21 @@ if __name__ == '__main__':
         sys.exit(1)
 '''
     
+    # Only rewrite when the template changed: warm re-runs do no writes and
+    # user edits to kokoro_server.py survive as long as the marker matches
+    # the template they started from.
+    digest = hashlib.sha256(server_script.encode()).hexdigest()
+    marker = Path(".kokoro_server.sha256")
+    if Path("kokoro_server.py").exists() and marker.exists() \
+            and marker.read_text().strip() == digest:
+        print("✓ kokoro_server.py up to date")
+        return
+
     with open("kokoro_server.py", "w") as f:
         f.write(server_script)
+    marker.write_text(digest)
+    # Precompile so the first server start skips the parse/compile step.
+    py_compile.compile("kokoro_server.py", doraise=True)
     print("✓ Created kokoro_server.py")
 
 def create_startup_script():
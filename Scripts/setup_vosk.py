@@ -4,35 +4,353 @@ Vosk Speech Recognition Setup Script
 This script downloads and sets up Vosk models for the Personal AI Assistant.
 """
 
+import io
+import mmap
 import os
+import py_compile
+import queue
+import struct
 import sys
+import threading
+import urllib.error
 import urllib.request
 import zipfile
+import zlib
 import json
 import shutil
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
 from pathlib import Path
 
+# Optional SIMD-accelerated deflate from isa-l (pip install isal): several
+# times the single-thread inflate bandwidth of stdlib zlib. Extraction
+# falls back to zipfile's zlib path when it isn't installed.
+try:
+    from isal import isal_zlib
+except ImportError:
+    isal_zlib = None
+
+# Optional multi-threaded deflate decoder (pip install rapidgzip), used for
+# very large members when --parallel-inflate is passed: a single 100MB+
+# deflate stream is chunked across cores instead of decoded serially.
+try:
+    import rapidgzip
+except ImportError:
+    rapidgzip = None
+
+PARALLEL_INFLATE = "--parallel-inflate" in sys.argv
+
+# Optional C-accelerated JSON serializer; stdlib json remains the fallback.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Members whose compressed size exceeds this get the parallel decoder.
+LARGE_MEMBER_THRESHOLD = 100 * (1 << 20)
+
+# Guards the carriage-return progress line when downloads run concurrently.
+PROGRESS_LOCK = threading.Lock()
+
+# Read and write in 1MB chunks: large socket reads and few write syscalls
+# matter on the 1.8GB models, where urlretrieve's small fixed blocks (and a
+# progress callback per block) dominate.
+DOWNLOAD_CHUNK_SIZE = 1 << 20
+
+# Models smaller than this are downloaded straight into memory and extracted
+# from there, so the zip itself never touches disk.
+IN_MEMORY_ZIP_LIMIT = 200 * (1 << 20)
+
+@dataclass(frozen=True)
+class ModelInfo:
+    """One entry in the fixed model catalog.
+
+    __slots__ (spelled out by hand — dataclass slots=True needs 3.10 and
+    this script supports 3.7+) gives direct attribute access instead of a
+    per-field dict hash on every reference.
+    """
+    __slots__ = ("name", "url", "size", "description", "recommended")
+    name: str
+    url: str
+    size: str
+    description: str
+    recommended: bool
+
+# Available Vosk models — fixed at import, so the catalog is a tuple of
+# immutable records rather than a nested dict rebuilt per call.
+MODELS = (
+    ModelInfo(
+        name="vosk-model-en-us-0.22",
+        url="https://alphacephei.com/vosk/models/vosk-model-en-us-0.22.zip",
+        size="1.8GB",
+        description="Large English model with high accuracy",
+        recommended=True,
+    ),
+    ModelInfo(
+        name="vosk-model-small-en-us-0.15",
+        url="https://alphacephei.com/vosk/models/vosk-model-small-en-us-0.15.zip",
+        size="40MB",
+        description="Small English model for quick testing",
+        recommended=False,
+    ),
+    ModelInfo(
+        name="vosk-model-en-us-0.21",
+        url="https://alphacephei.com/vosk/models/vosk-model-en-us-0.21.zip",
+        size="1.8GB",
+        description="Previous version English model",
+        recommended=False,
+    ),
+)
+
+def parse_size(size):
+    """Parse a human-readable size like '40MB' or '1.8GB' into bytes."""
+    size = size.strip().upper()
+    for suffix, factor in (("GB", 1 << 30), ("MB", 1 << 20), ("KB", 1 << 10)):
+        if size.endswith(suffix):
+            return int(float(size[:-len(suffix)]) * factor)
+    return int(size)
+
 def download_with_progress(url, filename):
-    """Download file with progress indicator."""
-    def progress_hook(block_num, block_size, total_size):
-        downloaded = block_num * block_size
-        if total_size > 0:
-            percent = min(100, (downloaded * 100) // total_size)
-            print(f"\rDownloading {filename}: {percent}%", end="", flush=True)
-    
+    """Download file with progress indicator.
+
+    A partial file left by an interrupted run is resumed with an HTTP Range
+    request, so a transient failure only costs the missing suffix instead
+    of a full re-download.
+    """
     try:
-        urllib.request.urlretrieve(url, filename, progress_hook)
+        start = Path(filename).stat().st_size if Path(filename).exists() else 0
+        headers = {"Range": f"bytes={start}-"} if start else {}
+        request = urllib.request.Request(url, headers=headers)
+        try:
+            response = urllib.request.urlopen(request)
+        except urllib.error.HTTPError as e:
+            if e.code == 416 and start:
+                # Requested range not satisfiable: file already complete.
+                print(f"✓ Downloaded {filename} (already complete)")
+                return True
+            raise
+        with response:
+            if start and response.getcode() != 206:
+                # Server ignored the Range request; restart from zero.
+                start = 0
+            total_size = int(response.headers.get("Content-Length", 0)) + start
+            downloaded = start
+            last_mb = -1
+            mode = 'ab' if start else 'wb'
+            with open(filename, mode, buffering=DOWNLOAD_CHUNK_SIZE) as f:
+                while True:
+                    chunk = response.read(DOWNLOAD_CHUNK_SIZE)
+                    if not chunk:
+                        break
+                    f.write(chunk)
+                    downloaded += len(chunk)
+                    # Throttle progress output to once per MB.
+                    if downloaded >> 20 != last_mb and total_size > 0:
+                        last_mb = downloaded >> 20
+                        percent = min(100, (downloaded * 100) // total_size)
+                        with PROGRESS_LOCK:
+                            print(f"\rDownloading {filename}: {percent}%", end="", flush=True)
         print(f"\n✓ Downloaded {filename}")
         return True
     except Exception as e:
         print(f"\n✗ Failed to download {filename}: {e}")
         return False
 
+# Reusable 1MB copy buffers shared across extraction workers, so streaming
+# a member out doesn't allocate a fresh scratch buffer per entry.
+BUFFER_POOL = queue.Queue()
+for _ in range((os.cpu_count() or 1) * 2):
+    BUFFER_POOL.put(bytearray(1 << 20))
+
+def copy_with_pooled_buffer(src, dst):
+    """Stream src into dst using a buffer borrowed from the shared pool."""
+    buf = BUFFER_POOL.get()
+    try:
+        view = memoryview(buf)
+        while True:
+            n = src.readinto(buf)
+            if not n:
+                break
+            dst.write(view[:n])
+    finally:
+        BUFFER_POOL.put(buf)
+
+def gzip_wrap(raw, info):
+    """Wrap a zip member's raw deflate bytes in a gzip container.
+
+    The central directory already records the member's CRC32 and
+    uncompressed size, which is exactly what the gzip trailer needs, so the
+    stream can be handed to gzip tooling (rapidgzip) without re-encoding.
+    """
+    header = b"\x1f\x8b\x08\x00\x00\x00\x00\x00\x00\xff"
+    trailer = struct.pack("<II", info.CRC & 0xFFFFFFFF, info.file_size & 0xFFFFFFFF)
+    return header + raw + trailer
+
+def parallel_inflate_member(raw, info, extract_to):
+    """Decompress one large member across all cores via rapidgzip."""
+    stream = io.BytesIO(gzip_wrap(raw, info))
+    with rapidgzip.RapidgzipFile(stream, parallelization=os.cpu_count()) as src, \
+            open(Path(extract_to) / info.filename, "wb") as dst:
+        shutil.copyfileobj(src, dst, DOWNLOAD_CHUNK_SIZE)
+
+def member_data_offset(buf, info):
+    """Offset of a member's compressed data within the archive bytes."""
+    header = buf[info.header_offset + 26:info.header_offset + 30]
+    name_len, extra_len = struct.unpack("<HH", header)
+    return info.header_offset + 30 + name_len + extra_len
+
+# Members larger (compressed) than this stream through a decompressobj in
+# 1MB slices instead of a one-shot inflate, so peak memory per worker stays
+# at a couple of buffers rather than the member's full compressed plus
+# decompressed size (hundreds of MB each in the large models).
+STREAM_MEMBER_THRESHOLD = 8 * (1 << 20)
+
+def member_raw_chunks(mm, info):
+    """Yield a member's compressed bytes as 1MB slices of the archive mmap."""
+    start = member_data_offset(mm, info)
+    end = start + info.compress_size
+    for offset in range(start, end, DOWNLOAD_CHUNK_SIZE):
+        yield mm[offset:min(offset + DOWNLOAD_CHUNK_SIZE, end)]
+
+def zip_is_valid(zip_path):
+    """Check archive integrity (central directory plus per-member CRCs).
+
+    Walks the members over an mmap view of the file instead of testzip's
+    serial seek/read loop, and uses isa-l's CRC32 when available (stdlib
+    zlib.crc32 is already hardware-accelerated on modern CPython). Each
+    member is inflated incrementally in 1MB slices, so validation memory
+    stays bounded no matter how large a member is.
+    """
+    if isal_zlib is not None:
+        decompressobj, crc32 = isal_zlib.decompressobj, isal_zlib.crc32
+    else:
+        decompressobj, crc32 = zlib.decompressobj, zlib.crc32
+    try:
+        with zipfile.ZipFile(zip_path) as zip_ref:
+            infos = zip_ref.infolist()
+            with open(zip_path, 'rb') as f, \
+                    mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                for info in infos:
+                    if info.is_dir():
+                        continue
+                    crc = 0
+                    if info.flag_bits & 0x1 or info.compress_type not in (
+                            zipfile.ZIP_DEFLATED, zipfile.ZIP_STORED):
+                        # Encrypted or exotic member: let zipfile handle it.
+                        crc = crc32(zip_ref.read(info.filename))
+                    elif info.compress_type == zipfile.ZIP_DEFLATED:
+                        decomp = decompressobj(-15)
+                        for chunk in member_raw_chunks(mm, info):
+                            crc = crc32(decomp.decompress(chunk), crc)
+                        crc = crc32(decomp.flush(), crc)
+                    else:
+                        for chunk in member_raw_chunks(mm, info):
+                            crc = crc32(chunk, crc)
+                    if crc & 0xFFFFFFFF != info.CRC:
+                        return False
+        return True
+    except Exception:
+        # Truncated central directory, bad deflate stream, short file, ...
+        # any failure mode means the archive is not usable.
+        return False
+
 def extract_model(zip_path, extract_to):
-    """Extract Vosk model from zip file."""
+    """Extract Vosk model from zip file.
+
+    The central directory is parsed once and the archive is mmap'd; every
+    worker slices its member's compressed bytes straight out of the shared
+    read-only mapping, so there is no per-thread file handle and no seek
+    contention. Inflation runs in parallel (zlib and isa-l release the
+    GIL), with isa-l's SIMD deflate used when installed.
+    """
     try:
         with zipfile.ZipFile(zip_path, 'r') as zip_ref:
-            zip_ref.extractall(extract_to)
+            infos = zip_ref.infolist()
+
+        base = Path(extract_to).resolve()
+
+        def safe_target(filename):
+            """Output path for a member, refusing names that escape base.
+
+            Manual extraction bypasses the sanitization extractall performs
+            in ZipFile._extract_member, so a hostile member like
+            ../evil.txt must be rejected here instead (zip-slip).
+            """
+            target = (base / filename).resolve()
+            if target != base and base not in target.parents:
+                raise ValueError(f"unsafe path in archive: {filename!r}")
+            return target
+
+        # Pre-create the unique set of output directories in one sequential
+        # pass (shortest paths first so parents come before children). The
+        # workers then only write files: mkdir/stat syscalls drop from
+        # O(entries) to O(unique directories) and nothing races on mkdir.
+        dirs = {str(safe_target(info.filename)) for info in infos
+                if info.is_dir()}
+        dirs |= {str(safe_target(info.filename).parent) for info in infos
+                 if not info.is_dir()}
+        for directory in sorted(dirs, key=len):
+            os.makedirs(directory, exist_ok=True)
+
+        if isal_zlib is not None:
+            inflate, decompressobj = isal_zlib.decompress, isal_zlib.decompressobj
+        else:
+            inflate, decompressobj = zlib.decompress, zlib.decompressobj
+
+        with open(zip_path, 'rb') as f, \
+                mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+
+            def extract_one(info):
+                if info.is_dir():
+                    return
+                target = safe_target(info.filename)
+                plain = not info.flag_bits & 0x1
+                if plain and info.compress_type in (zipfile.ZIP_DEFLATED,
+                                                    zipfile.ZIP_STORED):
+                    start = member_data_offset(mm, info)
+                    streaming = info.compress_size > STREAM_MEMBER_THRESHOLD
+                    if info.compress_type == zipfile.ZIP_STORED:
+                        if streaming:
+                            with open(target, "wb") as dst:
+                                for chunk in member_raw_chunks(mm, info):
+                                    dst.write(chunk)
+                        else:
+                            target.write_bytes(
+                                mm[start:start + info.compress_size])
+                        return
+                    # Very large members go to the multi-threaded decoder
+                    # when the flag is set; failures there fall through to
+                    # the single-threaded inflate below.
+                    if PARALLEL_INFLATE and rapidgzip is not None \
+                            and info.compress_size > LARGE_MEMBER_THRESHOLD:
+                        try:
+                            raw = mm[start:start + info.compress_size]
+                            parallel_inflate_member(raw, info, extract_to)
+                            return
+                        except Exception:
+                            pass
+                    if streaming:
+                        # Incremental inflate: holds one compressed slice
+                        # and its inflated output at a time, not the whole
+                        # member, so N workers can't stack up several GB.
+                        decomp = decompressobj(-15)
+                        with open(target, "wb") as dst:
+                            for chunk in member_raw_chunks(mm, info):
+                                dst.write(decomp.decompress(chunk))
+                            dst.write(decomp.flush())
+                    else:
+                        raw = mm[start:start + info.compress_size]
+                        target.write_bytes(inflate(raw, -15, info.file_size))
+                    return
+                # Encrypted or exotically-compressed member: stream it
+                # through a private zipfile handle with a pooled 1MB buffer.
+                with zipfile.ZipFile(zip_path, 'r') as zf, \
+                        zf.open(info) as src, open(target, "wb") as dst:
+                    copy_with_pooled_buffer(src, dst)
+
+            with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+                list(executor.map(extract_one, infos))
+
         print(f"✓ Extracted {zip_path}")
         return True
     except Exception as e:
@@ -43,78 +361,122 @@ def setup_vosk_models():
     """Download and setup Vosk models."""
     models_dir = Path("vosk_models")
     models_dir.mkdir(exist_ok=True)
-    
-    # Available Vosk models
-    models = {
-        "vosk-model-en-us-0.22": {
-            "url": "https://alphacephei.com/vosk/models/vosk-model-en-us-0.22.zip",
-            "size": "1.8GB",
-            "description": "Large English model with high accuracy",
-            "recommended": True
-        },
-        "vosk-model-small-en-us-0.15": {
-            "url": "https://alphacephei.com/vosk/models/vosk-model-small-en-us-0.15.zip",
-            "size": "40MB",
-            "description": "Small English model for quick testing",
-            "recommended": False
-        },
-        "vosk-model-en-us-0.21": {
-            "url": "https://alphacephei.com/vosk/models/vosk-model-en-us-0.21.zip",
-            "size": "1.8GB",
-            "description": "Previous version English model",
-            "recommended": False
-        }
-    }
-    
-    print("Available Vosk Models:")
-    print("=" * 40)
-    for i, (model_name, info) in enumerate(models.items(), 1):
-        status = "[RECOMMENDED]" if info["recommended"] else ""
-        print(f"{i}. {model_name} {status}")
-        print(f"   Size: {info['size']}")
-        print(f"   Description: {info['description']}")
-        print()
-    
+
+    # Build the menu in one string and write it with a single call: one
+    # flush instead of a stdout round-trip per print.
+    banner = "\n".join(
+        ["Available Vosk Models:", "=" * 40] +
+        [f"{i}. {model.name} {'[RECOMMENDED]' if model.recommended else ''}\n"
+         f"   Size: {model.size}\n"
+         f"   Description: {model.description}\n"
+         for i, model in enumerate(MODELS, 1)])
+    sys.stdout.write(banner + "\n")
+
     # Get user choice
     while True:
         try:
             choice = input("Select model to download (1-3, or 'all' for all models): ").strip().lower()
             if choice == 'all':
-                selected_models = list(models.keys())
+                selected_models = list(MODELS)
                 break
             elif choice in ['1', '2', '3']:
-                model_names = list(models.keys())
-                selected_models = [model_names[int(choice) - 1]]
+                selected_models = [MODELS[int(choice) - 1]]
                 break
             else:
                 print("Invalid choice. Please enter 1, 2, 3, or 'all'.")
         except (ValueError, IndexError):
             print("Invalid choice. Please enter 1, 2, 3, or 'all'.")
-    
-    # Download and extract selected models
-    for model_name in selected_models:
-        model_info = models[model_name]
-        model_dir = models_dir / model_name
-        
-        if model_dir.exists():
-            print(f"✓ {model_name} already exists")
+
+    # Download and extract selected models. Downloads run concurrently and
+    # each extraction starts as soon as its download lands, so network I/O
+    # overlaps with the disk/CPU work of unzipping the previous model.
+    to_fetch = []
+    for model in selected_models:
+        if (models_dir / model.name).exists():
+            print(f"✓ {model.name} already exists")
+        else:
+            to_fetch.append(model)
+
+    if not to_fetch:
+        return True
+
+    # Budget the free space across the selected models with one statvfs up
+    # front: each model needs roughly twice its advertised size while both
+    # the zip and the extracted files exist. Skipping over-budget models
+    # here beats hitting ENOSPC halfway through a 1.8GB download and
+    # leaving a partial extract behind.
+    available = shutil.disk_usage(models_dir).free
+    budgeted = []
+    for model in to_fetch:
+        needed = 2 * parse_size(model.size)
+        if needed > available:
+            print(f"⚠ Skipping {model.name}: needs ~{needed / (1 << 30):.1f}GB, "
+                  f"only {available / (1 << 30):.1f}GB free")
             continue
-        
-        print(f"\nDownloading {model_name} ({model_info['size']})...")
-        zip_path = models_dir / f"{model_name}.zip"
-        
-        # Download model
-        if download_with_progress(model_info["url"], str(zip_path)):
-            # Extract model
-            if extract_model(zip_path, models_dir):
+        available -= needed
+        budgeted.append(model)
+    to_fetch = budgeted
+
+    if not to_fetch:
+        return True
+
+    def fetch(model):
+        print(f"\nDownloading {model.name} ({model.size})...")
+
+        if parse_size(model.size) < IN_MEMORY_ZIP_LIMIT:
+            # Small model: download into memory and extract directly, never
+            # writing the intermediate zip to disk. Returns True when done.
+            try:
+                buf = io.BytesIO()
+                with urllib.request.urlopen(model.url) as response:
+                    shutil.copyfileobj(response, buf, DOWNLOAD_CHUNK_SIZE)
+                with zipfile.ZipFile(buf) as zip_ref:
+                    zip_ref.extractall(models_dir)
+                return True
+            except Exception as e:
+                print(f"\n✗ Failed to download {model.name}: {e}")
+                return None
+
+        # Large model: download (resuming any partial zip from a previous
+        # run) and CRC-validate before extraction; a corrupt file is thrown
+        # away and re-fetched once from scratch.
+        zip_path = models_dir / f"{model.name}.zip"
+        for _ in range(2):
+            if not download_with_progress(model.url, str(zip_path)):
+                return None
+            if zip_is_valid(zip_path):
+                return zip_path
+            print(f"⚠ {zip_path.name} failed validation, re-downloading...")
+            zip_path.unlink()
+        return None
+
+    with ThreadPoolExecutor(max_workers=min(len(to_fetch), 3)) as download_pool, \
+         ThreadPoolExecutor(max_workers=2) as extract_pool:
+        download_futures = {download_pool.submit(fetch, model): model
+                            for model in to_fetch}
+        extract_futures = {}
+        for future in as_completed(download_futures):
+            model = download_futures[future]
+            zip_path = future.result()
+            if zip_path is None:
+                print(f"✗ Failed to download {model.name}")
+                continue
+            if zip_path is True:
+                # Extracted in-memory during the download.
+                print(f"✓ {model.name} setup completed")
+                continue
+            extract_futures[extract_pool.submit(extract_model, zip_path, models_dir)] = \
+                (model, zip_path)
+
+        for future in as_completed(extract_futures):
+            model, zip_path = extract_futures[future]
+            if future.result():
                 # Remove zip file to save space
                 zip_path.unlink()
-                print(f"✓ {model_name} setup completed")
+                print(f"✓ {model.name} setup completed")
             else:
-                print(f"✗ Failed to extract {model_name}")
-        else:
-            print(f"✗ Failed to download {model_name}")
-    
+                print(f"✗ Failed to extract {model.name}")
+
     return True
 
 def create_vosk_config():
@@ -135,107 +497,21 @@ def create_vosk_config():
     }
     
     config_path = Path("vosk_config.json")
-    with open(config_path, 'w') as f:
-        json.dump(config, f, indent=2)
-    
+    if orjson is not None:
+        config_path.write_bytes(orjson.dumps(config, option=orjson.OPT_INDENT_2))
+    else:
+        with open(config_path, 'w') as f:
+            json.dump(config, f, indent=2)
+
     print(f"✓ Created {config_path}")
     return True
 
 def create_test_script():
     """Create a test script for Vosk."""
-    test_script = '''
-#!/usr/bin/env python3
-"""
-Vosk Speech Recognition Test Script
-"""
-
-import json
-import pyaudio
-import vosk
-import sys
-from pathlib import Path
-
-def test_vosk_model(model_path):
-    """Test Vosk model with microphone input."""
-    if not Path(model_path).exists():
-        print(f"Model not found: {model_path}")
-        return False
-    
-    try:
-        # Initialize Vosk
-        model = vosk.Model(model_path)
-        rec = vosk.KaldiRecognizer(model, 16000)
-        
-        # Initialize PyAudio
-        p = pyaudio.PyAudio()
-        stream = p.open(
-            format=pyaudio.paInt16,
-            channels=1,
-            rate=16000,
-            input=True,
-            frames_per_buffer=4096
-        )
-        
-        print("Vosk model loaded successfully!")
-        print("Speak into your microphone (press Ctrl+C to stop)...")
-        
-        try:
-            while True:
-                data = stream.read(4096, exception_on_overflow=False)
-                if rec.AcceptWaveform(data):
-                    result = json.loads(rec.Result())
-                    if result.get('text'):
-                        print(f"Recognized: {result['text']}")
-                else:
-                    partial = json.loads(rec.PartialResult())
-                    if partial.get('partial'):
-                        print(f"Partial: {partial['partial']}", end='\r')
-        
-        except KeyboardInterrupt:
-            print("\nStopping...")
-        
-        finally:
-            stream.stop_stream()
-            stream.close()
-            p.terminate()
-        
-        return True
-    
-    except Exception as e:
-        print(f"Error testing Vosk model: {e}")
-        return False
-
-def main():
-    """Main test function."""
-    print("Vosk Speech Recognition Test")
-    print("=" * 30)
-    
-    # Load config
-    config_path = Path("vosk_config.json")
-    if not config_path.exists():
-        print("Config file not found. Please run setup_vosk.py first.")
-        sys.exit(1)
-    
-    with open(config_path, 'r') as f:
-        config = json.load(f)
-    
-    # Test default model
-    model_name = config['default_model']
-    model_path = Path(config['models_directory']) / model_name
-    
-    print(f"Testing model: {model_name}")
-    if test_vosk_model(str(model_path)):
-        print("✓ Vosk test completed successfully!")
-    else:
-        print("✗ Vosk test failed.")
-        sys.exit(1)
-
-if __name__ == "__main__":
-    main()
-'''
-    
-    with open("test_vosk.py", "w") as f:
-        f.write(test_script)
+    template = Path(__file__).parent / "templates" / "test_vosk.py"
+    shutil.copyfile(template, "test_vosk.py")
+    # Precompile so the first run skips compile-on-import.
+    py_compile.compile("test_vosk.py", doraise=True)
     print("✓ Created test_vosk.py")
 
 def install_python_dependencies():
@@ -249,10 +525,25 @@ def install_python_dependencies():
         "scipy>=1.7.0"
     ]
     
+    pip_flags = ["--disable-pip-version-check", "--no-input", "--prefer-binary"]
+
     print("Installing Python dependencies for Vosk...")
+    # One batched pip call resolves the whole set in a single pass instead
+    # of paying interpreter startup and resolver initialization per package.
+    result = subprocess.run(
+        [sys.executable, "-m", "pip", "install", *pip_flags, *packages],
+        check=False
+    )
+    if result.returncode == 0:
+        print(f"✓ Installed {len(packages)} packages")
+        return True
+
+    # Batch failed: fall back to per-package installs so the offending
+    # package (and its hint, for PyAudio) is identified.
     for package in packages:
         try:
-            subprocess.check_call([sys.executable, "-m", "pip", "install", package])
+            subprocess.check_call(
+                [sys.executable, "-m", "pip", "install", *pip_flags, package])
             print(f"✓ Installed {package}")
         except subprocess.CalledProcessError as e:
             print(f"✗ Failed to install {package}: {e}")
@@ -275,7 +566,6 @@ def check_system_requirements():
     print(f"✓ Python {sys.version_info.major}.{sys.version_info.minor} detected")
     
     # Check available disk space (rough estimate)
-    import shutil
     free_space = shutil.disk_usage('.').free / (1024**3)  # GB
     if free_space < 5:
         print(f"⚠ Warning: Low disk space ({free_space:.1f}GB available). Models require 2-4GB.")
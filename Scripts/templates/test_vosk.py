@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Vosk Speech Recognition Test Script
+"""
+
+import json
+import pyaudio
+import vosk
+import sys
+from pathlib import Path
+
+# orjson parses the recognizer's JSON results several times faster than
+# stdlib json; fall back transparently when it isn't installed.
+try:
+    from orjson import loads
+except ImportError:
+    from json import loads
+
+# Frames handed to the recognizer per read. Doubling the 4096 default
+# halves the Python-level read/AcceptWaveform round-trips on the hot loop
+# (each AcceptWaveform call copies its bytes into Kaldi regardless).
+FRAMES_PER_CHUNK = 8192
+
+def test_vosk_model(model_path):
+    """Test Vosk model with microphone input."""
+    if not Path(model_path).exists():
+        print(f"Model not found: {model_path}")
+        return False
+    
+    try:
+        # Initialize Vosk
+        model = vosk.Model(model_path)
+        rec = vosk.KaldiRecognizer(model, 16000)
+        
+        # Initialize PyAudio
+        p = pyaudio.PyAudio()
+        stream = p.open(
+            format=pyaudio.paInt16,
+            channels=1,
+            rate=16000,
+            input=True,
+            frames_per_buffer=FRAMES_PER_CHUNK
+        )
+        
+        print("Vosk model loaded successfully!")
+        print("Speak into your microphone (press Ctrl+C to stop)...")
+        
+        try:
+            while True:
+                data = stream.read(FRAMES_PER_CHUNK, exception_on_overflow=False)
+                if rec.AcceptWaveform(data):
+                    result = loads(rec.Result())
+                    if result.get('text'):
+                        print(f"Recognized: {result['text']}")
+                else:
+                    partial = loads(rec.PartialResult())
+                    if partial.get('partial'):
+                        print(f"Partial: {partial['partial']}", end='\r')
+        
+        except KeyboardInterrupt:
+            print("\nStopping...")
+        
+        finally:
+            stream.stop_stream()
+            stream.close()
+            p.terminate()
+        
+        return True
+    
+    except Exception as e:
+        print(f"Error testing Vosk model: {e}")
+        return False
+
+def main():
+    """Main test function."""
+    print("Vosk Speech Recognition Test")
+    print("=" * 30)
+    
+    # Load config
+    config_path = Path("vosk_config.json")
+    if not config_path.exists():
+        print("Config file not found. Please run setup_vosk.py first.")
+        sys.exit(1)
+    
+    with open(config_path, 'r') as f:
+        config = json.load(f)
+    
+    # Test default model
+    model_name = config['default_model']
+    model_path = Path(config['models_directory']) / model_name
+    
+    print(f"Testing model: {model_name}")
+    if test_vosk_model(str(model_path)):
+        print("✓ Vosk test completed successfully!")
+    else:
+        print("✗ Vosk test failed.")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()